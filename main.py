@@ -1,16 +1,21 @@
-import uuid
+import secrets
 from fastapi import FastAPI, HTTPException, Response
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, EmailStr
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, EmailStr, constr, field_validator, model_validator
 from motor.motor_asyncio import AsyncIOMotorClient
-from pymongo.errors import ConnectionFailure, PyMongoError
-import resend
+from pymongo import WriteConcern
+from pymongo.errors import ConnectionFailure
+import httpx
+import orjson
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 from datetime import datetime, timezone
 import os
+import time
 import logging
 import asyncio
+from collections import ChainMap
+from contextlib import asynccontextmanager
 from typing import Union
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
@@ -21,12 +26,48 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
+# Application lifespan: connect to Mongo, start the write flusher and open
+# the Resend client on the way in; tear everything down on the way out
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    try:
+        await connect_to_mongodb()
+    except Exception as e:
+        logger.error(f"Failed to connect to MongoDB after retries: {e}")
+        raise HTTPException(status_code=500, detail="Database connection failed")
+    app.state.writer_task = asyncio.create_task(flush_write_queue())
+    app.state.writer_task.add_done_callback(_on_writer_done)
+    global resend_client
+    resend_client = httpx.AsyncClient(
+        base_url="https://api.resend.com",
+        headers={"Authorization": f"Bearer {RESEND_API_KEY}"},
+        http2=True,
+        timeout=10.0
+    )
+    yield
+    # Wait for the flusher to actually stop so a cancel fired mid-insert_many
+    # cannot race the client teardown below
+    app.state.writer_task.cancel()
+    try:
+        await app.state.writer_task
+    except asyncio.CancelledError:
+        pass
+    if resend_client:
+        await resend_client.aclose()
+    client = getattr(app.state, "mongo_client", None)
+    if client:
+        client.close()
+        logger.info("MongoDB connection closed")
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Portfolio Project Request API",
     description="API for submitting project, hiring, and contact requests to Muhammad Ahmad's portfolio.",
-    version="1.1.0"
+    version="1.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
+app.state.bg_tasks = set()
 
 # CORS configuration
 ALLOWED_ORIGINS = os.getenv("ALLOWED_ORIGINS", "http://localhost:3000,http://localhost:8080,https://m-ahmad-portfolio-dev.netlify.app").split(",")
@@ -38,6 +79,15 @@ app.add_middleware(
     allow_headers=["Content-Type", "Authorization", "Accept", "X-Requested-With"],
 )
 
+# Preflight body and headers never change, so serialize them once at import
+_PREFLIGHT_BODY = orjson.dumps({"status": "ok"})
+_PREFLIGHT_HEADERS = {
+    "Access-Control-Allow-Origin": ",".join(ALLOWED_ORIGINS),
+    "Access-Control-Allow-Methods": "GET,POST,OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type,Authorization,Accept,X-Requested-With",
+    "Access-Control-Allow-Credentials": "true"
+}
+
 # MongoDB configuration
 MONGO_URI = os.getenv("MONGO_URI")
 if not MONGO_URI:
@@ -48,15 +98,15 @@ if not MONGO_URI:
 RESEND_API_KEY = os.getenv("RESEND_API_KEY")
 if not RESEND_API_KEY:
     logger.warning("RESEND_API_KEY not set. Email notifications will not work.")
-else:
-    resend.api_key = RESEND_API_KEY
 
-# Initialize MongoDB client
-client = None
-db = None
-collection = None
+# Shared async HTTP client for the Resend API, created at startup; HTTP/2
+# keep-alive reuses one TLS connection across email sends
+resend_client = None
+
+# Pydantic models for request validation; the blank/length/cross-field checks
+# run inside pydantic-core during request parsing rather than in Python after
+NonBlankStr = constr(strip_whitespace=True, min_length=1)
 
-# Pydantic models for request validation
 class ProjectDetails(BaseModel):
     clientType: str | None = None
     clientName: str | None = None
@@ -67,56 +117,36 @@ class ProjectDetails(BaseModel):
     requirements: str | None = None
     contactEmail: EmailStr
 
+    @model_validator(mode="after")
+    def _check_client_fields(self):
+        if self.clientType and self.clientType not in ("company", "individual"):
+            raise ValueError("Invalid client type")
+        if self.clientType == "company" and not self.companyName:
+            raise ValueError("Company name is required for company client type")
+        if self.clientType == "individual" and not self.clientName:
+            raise ValueError("Client name is required for individual client type")
+        return self
+
 class HiringDetails(BaseModel):
     clientType: str = "company"
-    companyName: str
-    positionTitle: str
-    budget: str
-    timeline: str
-    requirements: str
+    companyName: NonBlankStr
+    positionTitle: NonBlankStr
+    budget: NonBlankStr
+    timeline: NonBlankStr
+    requirements: NonBlankStr
     contactEmail: EmailStr
 
+    @field_validator("clientType")
+    @classmethod
+    def _must_be_company(cls, v: str) -> str:
+        if v != "company":
+            raise ValueError("Client type must be 'company' for hiring requests")
+        return v
+
 class ContactDetails(BaseModel):
-    name: str
+    name: NonBlankStr
     email: EmailStr
-    message: str
-
-# Helper function to validate project details
-def validate_project_details(details: ProjectDetails) -> None:
-    if not details.contactEmail:
-        raise HTTPException(status_code=400, detail="Contact email is required")
-    if details.clientType and details.clientType not in ["company", "individual"]:
-        raise HTTPException(status_code=400, detail="Invalid client type")
-    if details.clientType == "company" and not details.companyName:
-        raise HTTPException(status_code=400, detail="Company name is required for company client type")
-    if details.clientType == "individual" and not details.clientName:
-        raise HTTPException(status_code=400, detail="Client name is required for individual client type")
-
-# Helper function to validate hiring details
-def validate_hiring_details(details: HiringDetails) -> None:
-    if details.clientType != "company":
-        raise HTTPException(status_code=400, detail="Client type must be 'company' for hiring requests")
-    if not details.companyName.strip():
-        raise HTTPException(status_code=400, detail="Company name is required")
-    if not details.positionTitle.strip():
-        raise HTTPException(status_code=400, detail="Position title is required")
-    if not details.budget.strip():
-        raise HTTPException(status_code=400, detail="Budget is required")
-    if not details.timeline.strip():
-        raise HTTPException(status_code=400, detail="Timeline is required")
-    if not details.requirements.strip():
-        raise HTTPException(status_code=400, detail="Requirements are required")
-    if not details.contactEmail:
-        raise HTTPException(status_code=400, detail="Contact email is required")
-
-# Helper function to validate contact details
-def validate_contact_details(details: ContactDetails) -> None:
-    if not details.name.strip():
-        raise HTTPException(status_code=400, detail="Name is required")
-    if not details.message.strip():
-        raise HTTPException(status_code=400, detail="Message is required")
-    if len(details.message) > 1000:
-        raise HTTPException(status_code=400, detail="Message cannot exceed 1000 characters")
+    message: constr(strip_whitespace=True, min_length=1, max_length=1000)
 
 # Retry decorator for MongoDB connection
 @retry(
@@ -126,18 +156,143 @@ def validate_contact_details(details: ContactDetails) -> None:
     before_sleep=lambda retry_state: logger.info(f"Retrying MongoDB connection (attempt {retry_state.attempt_number})...")
 )
 async def connect_to_mongodb():
-    global client, db, collection
-    client = AsyncIOMotorClient(MONGO_URI, serverSelectionTimeoutMS=5000)
+    # Warm pool avoids TCP/TLS handshakes on the hot path; zstd compresses
+    # the wire protocol for the JSON-heavy documents stored here
+    client = AsyncIOMotorClient(
+        MONGO_URI,
+        serverSelectionTimeoutMS=5000,
+        maxPoolSize=200,
+        minPoolSize=20,
+        maxIdleTimeMS=30000,
+        compressors="zstd",
+        retryWrites=True
+    )
     await client.admin.command("ping")
     db = client["portfolio"]
-    collection = db["project_requests"]
+    # Unacknowledged writes skip the primary's ack round-trip; losing the odd
+    # contact form is acceptable. collection_ack stays at the default w=1 for
+    # any endpoint that later needs durable confirmation.
+    collection = db.get_collection("project_requests", write_concern=WriteConcern(w=0))
+    collection_ack = db.get_collection("project_requests")
+    # Index through the acknowledged handle: createIndexes must not run with
+    # w=0. Unique request_id supports idempotent retries; (type, created_at)
+    # covers the obvious admin queries as the collection grows.
+    await collection_ack.create_index("request_id", unique=True, background=True)
+    await collection_ack.create_index([("type", 1), ("created_at", -1)], background=True)
+    # Handles live on app.state rather than module globals, so consumers can
+    # bind them to fast locals instead of paying LOAD_GLOBAL per access
+    app.state.mongo_client = client
+    app.state.db = db
+    app.state.collection = collection
+    app.state.collection_ack = collection_ack
     logger.info("MongoDB connection established")
 
+# Batched write path: routes enqueue documents and return immediately; the
+# background flusher groups them into a single unordered insert_many
+BATCH_MAX_DOCS = 100
+BATCH_FLUSH_SECONDS = 0.05
+
+write_queue: asyncio.Queue = asyncio.Queue()
+
+async def flush_write_queue():
+    coll = app.state.collection
+    while True:
+        docs = [await write_queue.get()]
+        try:
+            while len(docs) < BATCH_MAX_DOCS:
+                docs.append(await asyncio.wait_for(write_queue.get(), timeout=BATCH_FLUSH_SECONDS))
+        except asyncio.TimeoutError:
+            pass
+        try:
+            await coll.insert_many(docs, ordered=False)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # BSON encoding errors (e.g. DocumentTooLarge) are not PyMongoError
+            # subclasses; anything escaping here would kill the flusher for good
+            logger.error(f"Batch insert failed for {len(docs)} document(s): {e}")
+
+# Callback to make a dead flusher loud: a silent exit means every subsequent
+# submission piles up in the queue without ever reaching Mongo
+def _on_writer_done(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception():
+        logger.error(f"Write flusher task died: {task.exception()}")
+
+# Email subjects and HTML skeletons built once at import time; per-request
+# work is reduced to a single format_map over the model's attribute dict
+PROJECT_EMAIL_SUBJECT = "New Project Request from AI Assistant"
+PROJECT_EMAIL_TEMPLATE = (
+    "<h3>New Project Request</h3>"
+    "<p><strong>Client Type:</strong> {clientType}</p>"
+    "<p><strong>{nameLabel}:</strong> {displayName}</p>"
+    "<p><strong>Project Type:</strong> {projectType}</p>"
+    "<p><strong>Budget:</strong> {budget}</p>"
+    "<p><strong>Timeline:</strong> {timeline}</p>"
+    "<p><strong>Requirements:</strong> {requirements}</p>"
+    "<p><strong>Contact Email:</strong> {contactEmail}</p>"
+    "<p><strong>Received At:</strong> {received_at} UTC</p>"
+)
+
+HIRING_EMAIL_SUBJECT = "New Hiring Request from AI Assistant"
+HIRING_EMAIL_TEMPLATE = (
+    "<h3>New Hiring Request</h3>"
+    "<p><strong>Client Type:</strong> {clientType}</p>"
+    "<p><strong>Company Name:</strong> {companyName}</p>"
+    "<p><strong>Position Title:</strong> {positionTitle}</p>"
+    "<p><strong>Budget:</strong> {budget}</p>"
+    "<p><strong>Timeline:</strong> {timeline}</p>"
+    "<p><strong>Requirements:</strong> {requirements}</p>"
+    "<p><strong>Contact Email:</strong> {contactEmail}</p>"
+    "<p><strong>Received At:</strong> {received_at} UTC</p>"
+)
+
+CONTACT_EMAIL_SUBJECT = "New Contact Form Submission"
+CONTACT_EMAIL_TEMPLATE = (
+    "<h3>New Contact Form Submission</h3>"
+    "<p><strong>Name:</strong> {name}</p>"
+    "<p><strong>Email:</strong> {email}</p>"
+    "<p><strong>Message:</strong> {message}</p>"
+    "<p><strong>Received At:</strong> {received_at} UTC</p>"
+)
+
+# Second-granularity timestamp cache: strftime only re-runs when the clock
+# ticks over to a new second
+_cached_ts: tuple[int, str] = (0, "")
+
+def _now_str() -> str:
+    global _cached_ts
+    s = int(time.time())
+    if s != _cached_ts[0]:
+        _cached_ts = (s, datetime.fromtimestamp(s, timezone.utc).strftime('%Y-%m-%d %H:%M:%S'))
+    return _cached_ts[1]
+
+# Per-model subject/HTML builders, dispatched by exact type below instead of
+# walking isinstance checks on every email
+def _build_project_email(details: ProjectDetails) -> tuple[str, str]:
+    fields = {k: v or "Not specified" for k, v in vars(details).items()}
+    fields["nameLabel"] = "Company Name" if details.clientType == "company" else "Client Name"
+    fields["displayName"] = details.companyName or details.clientName or "Not specified"
+    fields["received_at"] = _now_str()
+    return PROJECT_EMAIL_SUBJECT, PROJECT_EMAIL_TEMPLATE.format_map(fields)
+
+def _build_hiring_email(details: HiringDetails) -> tuple[str, str]:
+    return HIRING_EMAIL_SUBJECT, HIRING_EMAIL_TEMPLATE.format_map(ChainMap({"received_at": _now_str()}, vars(details)))
+
+def _build_contact_email(details: ContactDetails) -> tuple[str, str]:
+    return CONTACT_EMAIL_SUBJECT, CONTACT_EMAIL_TEMPLATE.format_map(ChainMap({"received_at": _now_str()}, vars(details)))
+
+_EMAIL_BUILDERS = {
+    ProjectDetails: _build_project_email,
+    HiringDetails: _build_hiring_email,
+    ContactDetails: _build_contact_email,
+}
+
 # Consolidated helper function to send email via Resend with retry
 @retry(
     stop=stop_after_attempt(3),
     wait=wait_exponential(multiplier=1, min=2, max=5),
-    retry=retry_if_exception_type(Exception),
+    retry=retry_if_exception_type((httpx.HTTPError, asyncio.TimeoutError, ConnectionError)),
+    reraise=True,
     before_sleep=lambda retry_state: logger.info(f"Retrying email send (attempt {retry_state.attempt_number})...")
 )
 async def send_email(details: Union[ProjectDetails, HiringDetails, ContactDetails]) -> bool:
@@ -146,115 +301,66 @@ async def send_email(details: Union[ProjectDetails, HiringDetails, ContactDetail
         return False
 
     try:
+        subject, html = _EMAIL_BUILDERS[type(details)](details)
+
         email_content = {
             "from": "onboarding@resend.dev",
             "to": "ahmadrajpootr1@gmail.com",
-            "subject": "",
-            "html": ""
+            "subject": subject,
+            "html": html
         }
 
-        if isinstance(details, ProjectDetails):
-            email_content["subject"] = "New Project Request from AI Assistant"
-            email_content["html"] = (
-                f"<h3>New Project Request</h3>"
-                f"<p><strong>Client Type:</strong> {details.clientType or 'Not specified'}</p>"
-                f"<p><strong>{'Company Name' if details.clientType == 'company' else 'Client Name'}:</strong> "
-                f"{details.companyName or details.clientName or 'Not specified'}</p>"
-                f"<p><strong>Project Type:</strong> {details.projectType or 'Not specified'}</p>"
-                f"<p><strong>Budget:</strong> {details.budget or 'Not specified'}</p>"
-                f"<p><strong>Timeline:</strong> {details.timeline or 'Not specified'}</p>"
-                f"<p><strong>Requirements:</strong> {details.requirements or 'Not specified'}</p>"
-                f"<p><strong>Contact Email:</strong> {details.contactEmail}</p>"
-                f"<p><strong>Received At:</strong> {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')} UTC</p>"
-            )
-        elif isinstance(details, HiringDetails):
-            email_content["subject"] = "New Hiring Request from AI Assistant"
-            email_content["html"] = (
-                f"<h3>New Hiring Request</h3>"
-                f"<p><strong>Client Type:</strong> {details.clientType}</p>"
-                f"<p><strong>Company Name:</strong> {details.companyName}</p>"
-                f"<p><strong>Position Title:</strong> {details.positionTitle}</p>"
-                f"<p><strong>Budget:</strong> {details.budget}</p>"
-                f"<p><strong>Timeline:</strong> {details.timeline}</p>"
-                f"<p><strong>Requirements:</strong> {details.requirements}</p>"
-                f"<p><strong>Contact Email:</strong> {details.contactEmail}</p>"
-                f"<p><strong>Received At:</strong> {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')} UTC</p>"
-            )
-        else:  # ContactDetails
-            email_content["subject"] = "New Contact Form Submission"
-            email_content["html"] = (
-                f"<h3>New Contact Form Submission</h3>"
-                f"<p><strong>Name:</strong> {details.name}</p>"
-                f"<p><strong>Email:</strong> {details.email}</p>"
-                f"<p><strong>Message:</strong> {details.message}</p>"
-                f"<p><strong>Received At:</strong> {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')} UTC</p>"
-            )
-
-        response = await asyncio.to_thread(resend.Emails.send, email_content)
-        logger.info(f"Email sent successfully: Message ID {response['id']}")
+        response = await resend_client.post("/emails", json=email_content)
+        response.raise_for_status()
+        logger.info(f"Email sent successfully: Message ID {response.json()['id']}")
         return True
     except Exception as e:
         logger.error(f"Resend error: {str(e)}")
         raise
 
+# Callback to log background email failures and release the task reference
+def _on_email_done(task: asyncio.Task) -> None:
+    app.state.bg_tasks.discard(task)
+    if not task.cancelled() and task.exception():
+        logger.error(f"Background email send failed: {task.exception()}")
+
+# Schedule the email send without blocking the response; the task set keeps a
+# strong reference so the task is not garbage-collected mid-flight
+def queue_email(details: Union[ProjectDetails, HiringDetails, ContactDetails]) -> None:
+    task = asyncio.create_task(send_email(details))
+    app.state.bg_tasks.add(task)
+    task.add_done_callback(_on_email_done)
+
 # Explicit OPTIONS handler for CORS preflight requests
 @app.options("/api/{path:path}")
 async def handle_options():
-    return JSONResponse(
-        content={"status": "ok"},
-        headers={
-            "Access-Control-Allow-Origin": ",".join(ALLOWED_ORIGINS),
-            "Access-Control-Allow-Methods": "GET,POST,OPTIONS",
-            "Access-Control-Allow-Headers": "Content-Type,Authorization,Accept,X-Requested-With",
-            "Access-Control-Allow-Credentials": "true"
-        }
+    return Response(
+        content=_PREFLIGHT_BODY,
+        media_type="application/json",
+        headers=_PREFLIGHT_HEADERS
     )
 
-# FastAPI startup event
-@app.on_event("startup")
-async def startup_event():
+# Shared submission path for all three POST routes: build the Mongo document,
+# enqueue the insert and the email, and answer with the request ID
+async def _submit(details, kind: str, success_msg: str):
     try:
-        await connect_to_mongodb()
-    except Exception as e:
-        logger.error(f"Failed to connect to MongoDB after retries: {e}")
-        raise HTTPException(status_code=500, detail="Database connection failed")
+        keys = details.__pydantic_fields_set__ if type(details) is ProjectDetails else type(details).model_fields
+        data = {k: getattr(details, k) for k in keys}
+        data["created_at"] = datetime.now(timezone.utc)
+        data["type"] = kind
+        data["request_id"] = secrets.token_hex(16)
 
-# FastAPI shutdown event
-@app.on_event("shutdown")
-async def shutdown_event():
-    global client
-    if client:
-        client.close()
-        logger.info("MongoDB connection closed")
+        write_queue.put_nowait(data)
 
-@app.post(
-    "/api/project-request",
-    summary="Submit a project request",
-    response_description="Confirmation message and request ID"
-)
-async def submit_project_request(details: ProjectDetails):
-    try:
-        validate_project_details(details)
-        project_data = details.model_dump(exclude_unset=True)
-        project_data["created_at"] = datetime.now(timezone.utc)
-        project_data["type"] = "project_request"
-        project_data["request_id"] = str(uuid.uuid4())
-
-        result = await collection.insert_one(project_data)
-        if not result.inserted_id:
-            raise PyMongoError("Failed to store project details in MongoDB")
-
-        email_sent = await send_email(details)
-        return {
-            "message": "Project request submitted successfully. Muhammad Ahmad will contact you soon!",
-            "request_id": project_data["request_id"],
-            "email_sent": email_sent
-        }
-    except HTTPException as e:
-        raise e
-    except PyMongoError as e:
-        logger.error(f"MongoDB error: {e}")
-        raise HTTPException(status_code=500, detail="Failed to store project details")
+        queue_email(details)
+        return ORJSONResponse(
+            content={
+                "message": success_msg,
+                "request_id": data["request_id"],
+                "email_sent": "queued"
+            },
+            status_code=200
+        )
     except Exception as e:
         logger.error(f"Unexpected error: {e}")
         raise HTTPException(
@@ -262,76 +368,52 @@ async def submit_project_request(details: ProjectDetails):
             detail="An error occurred. Please try again or contact Muhammad directly at ahmadrajpootr1@gmail.com."
         )
 
+@app.post(
+    "/api/project-request",
+    summary="Submit a project request",
+    response_description="Confirmation message and request ID",
+    response_model=None
+)
+async def submit_project_request(details: ProjectDetails):
+    return await _submit(
+        details,
+        "project_request",
+        "Project request submitted successfully. Muhammad Ahmad will contact you soon!"
+    )
+
 @app.post(
     "/api/hiring-request",
     summary="Submit a hiring request",
-    response_description="Confirmation message and request ID"
+    response_description="Confirmation message and request ID",
+    response_model=None
 )
 async def submit_hiring_request(details: HiringDetails):
-    try:
-        validate_hiring_details(details)
-        hiring_data = details.model_dump()
-        hiring_data["created_at"] = datetime.now(timezone.utc)
-        hiring_data["type"] = "hiring_request"
-        hiring_data["request_id"] = str(uuid.uuid4())
-
-        result = await collection.insert_one(hiring_data)
-        if not result.inserted_id:
-            raise PyMongoError("Failed to store hiring details in MongoDB")
-
-        email_sent = await send_email(details)
-        return {
-            "message": "Hiring request submitted successfully. Muhammad Ahmad will contact you soon!",
-            "request_id": hiring_data["request_id"],
-            "email_sent": email_sent
-        }
-    except HTTPException as e:
-        raise e
-    except PyMongoError as e:
-        logger.error(f"MongoDB error: {e}")
-        raise HTTPException(status_code=500, detail="Failed to store hiring details")
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail="An error occurred. Please try again or contact Muhammad directly at ahmadrajpootr1@gmail.com."
-        )
+    return await _submit(
+        details,
+        "hiring_request",
+        "Hiring request submitted successfully. Muhammad Ahmad will contact you soon!"
+    )
 
 @app.post(
     "/api/contact",
     summary="Submit a contact form",
-    response_description="Confirmation message and request ID"
+    response_description="Confirmation message and request ID",
+    response_model=None
 )
 async def submit_contact_request(details: ContactDetails):
-    try:
-        validate_contact_details(details)
-        contact_data = details.model_dump()
-        contact_data["created_at"] = datetime.now(timezone.utc)
-        contact_data["type"] = "contact_request"
-        contact_data["request_id"] = str(uuid.uuid4())
-
-        result = await collection.insert_one(contact_data)
-        if not result.inserted_id:
-            raise PyMongoError("Failed to store contact details in MongoDB")
-
-        email_sent = await send_email(details)
-        return {
-            "message": "Your message has been sent to Muhammad Ahmad. He will contact you soon!",
-            "request_id": contact_data["request_id"],
-            "email_sent": email_sent
-        }
-    except HTTPException as e:
-        raise e
-    except PyMongoError as e:
-        logger.error(f"MongoDB error: {e}")
-        raise HTTPException(status_code=500, detail="Failed to store contact details")
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail="An error occurred. Please try again or contact Muhammad directly at ahmadrajpootr1@gmail.com."
-        )
+    return await _submit(
+        details,
+        "contact_request",
+        "Your message has been sent to Muhammad Ahmad. He will contact you soon!"
+    )
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=5000)
\ No newline at end of file
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=5000,
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count()
+    )
\ No newline at end of file